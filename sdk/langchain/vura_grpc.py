@@ -0,0 +1,96 @@
+"""
+Agent Veil gRPC streaming transport (optional).
+
+Carries chat chunks as length-prefixed binary frames over a gRPC
+server-streaming call ("/vura.Chat/Stream") instead of SSE text, which
+drops the per-token "data: " framing and JSON-over-text overhead.
+Messages are JSON-serialized on the wire, so no generated protobuf
+stubs are needed.
+
+The proxy must separately expose a gRPC endpoint with this method; the
+bundled HTTP proxy in this repo does not serve gRPC at all. Requires
+grpcio. AgentVeilChatModel(transport="grpc") falls back to SSE when the
+target speaks no usable gRPC: a gRPC-capable proxy without the method
+answers UNIMPLEMENTED, while an HTTP-only proxy fails the dial with
+UNAVAILABLE - is_unsupported() covers both.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, Optional
+
+try:
+    import grpc
+except ImportError:
+    grpc = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_STREAM_METHOD = "/vura.Chat/Stream"
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def available() -> bool:
+    return grpc is not None
+
+
+def grpc_target(proxy_url: str) -> str:
+    """Convert an http(s) proxy URL into a host:port gRPC target."""
+    return proxy_url.split("://", 1)[-1].rstrip("/")
+
+
+def is_unsupported(exc: Exception) -> bool:
+    """True when the error means the target has no usable gRPC service:
+    UNIMPLEMENTED (no such method) or UNAVAILABLE (dial failed, e.g. an
+    HTTP-only proxy)."""
+    return (
+        grpc is not None
+        and isinstance(exc, grpc.RpcError)
+        and exc.code()
+        in (grpc.StatusCode.UNIMPLEMENTED, grpc.StatusCode.UNAVAILABLE)
+    )
+
+
+def stream_chat(
+    target: str,
+    payload: dict,
+    metadata: Optional[list] = None,
+    timeout: float = 120,
+) -> Iterator[str]:
+    """Yield content chunks for one chat request over gRPC streaming.
+
+    grpc.RpcError propagates to the caller; check is_unsupported() to
+    decide whether to fall back to SSE.
+    """
+    if grpc is None:
+        raise RuntimeError(
+            "grpcio is required for transport='grpc': pip install grpcio"
+        )
+    channel = grpc.insecure_channel(target)
+    try:
+        stub = channel.unary_stream(
+            _STREAM_METHOD,
+            request_serializer=_dumps,
+            response_deserializer=_loads,
+        )
+        for chunk in stub(payload, metadata=metadata, timeout=timeout):
+            content = chunk.get("content")
+            if content:
+                yield content
+    finally:
+        channel.close()
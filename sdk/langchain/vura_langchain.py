@@ -15,11 +15,225 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
+import hashlib
 import json
 import os
+import queue
+import re
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain
+from types import MappingProxyType
 from typing import Any, Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON; stdlib json is the fallback
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # optional; only needed for the async chat methods
+    httpx = None
+
+try:
+    import simdjson  # pysimdjson; worthwhile on multi-KB audit reports
+except ImportError:
+    simdjson = None
+
+try:
+    import vura_grpc  # sibling module; optional gRPC streaming transport
+except ImportError:
+    vura_grpc = None
+
+_SIMD_TLS = threading.local()
+
+_SSE_DATA_PREFIX = b"data: "
+_SSE_DONE = b"[DONE]"
+
+# Cheap local sniff, aligned with pkg/pii/patterns.go: every branch there
+# needs a digit (ids, dates, SSN, IPs, plates, cards), an "@" (email), an
+# "="/":" (secret assignments, conn strings), an "_"/"-" (token prefixes
+# like ghp_/xoxb-), or one of the Vietnamese keywords below. Short texts
+# with none of these cannot match and skip the round-trip.
+_CHEAP_PII_RE = re.compile(r"[@=:_\-]|\d")
+_VN_PII_KEYWORDS = (
+    "cccd",
+    "cmnd",
+    "mst",
+    "bhxh",
+    "stk",
+    "tài khoản",
+    "bảo hiểm",
+    "đường",
+    "phố",
+    "phường",
+)
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _loads_large(data: bytes) -> Any:
+    """Parse a large response body, reusing a thread-local simdjson parser."""
+    if simdjson is not None:
+        parser = getattr(_SIMD_TLS, "parser", None)
+        if parser is None:
+            parser = _SIMD_TLS.parser = simdjson.Parser()
+        return parser.parse(data).as_dict()
+    return _loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a request body straight to UTF-8 bytes for urllib3."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Small JSON POSTs must not sit in the socket buffer waiting for an ACK
+# (Nagle); newer urllib3 sets TCP_NODELAY in its defaults, this makes it
+# explicit and adds TCP_QUICKACK where the platform has it.
+_NODELAY_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+    _NODELAY_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
+
+class _NoDelayAdapter(HTTPAdapter):
+    """HTTPAdapter that disables Nagle's algorithm on its pooled sockets."""
+
+    _SOCKET_OPTIONS = list(HTTPConnection.default_socket_options) + _NODELAY_OPTIONS
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def _build_session() -> requests.Session:
+    """Build a pooled Session shared by all SDK helpers (keep-alive + retries)."""
+    session = requests.Session()
+    adapter = _NoDelayAdapter(
+        pool_connections=32,
+        pool_maxsize=128,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+_SESSION = _build_session()
+
+
+class _KeepAliveAdapter(_NoDelayAdapter):
+    """_NoDelayAdapter that also turns on TCP keep-alive for its sockets."""
+
+    _SOCKET_OPTIONS = _NoDelayAdapter._SOCKET_OPTIONS + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):  # Linux only
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+
+
+_TLS = threading.local()
+
+
+def _thread_session() -> requests.Session:
+    """Per-thread Session with its own small pool and a sticky keep-alive
+    connection to the proxy; sidesteps the shared pool's lock under high
+    scan concurrency."""
+    session = getattr(_TLS, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = _KeepAliveAdapter(pool_connections=1, pool_maxsize=4)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        _TLS.session = session
+    return session
+
+
+# Shared pool for fanning out independent scan calls; HTTP I/O releases
+# the GIL, so threads give near-linear speedup up to the pool size.
+_SCAN_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("VEIL_SCAN_CONCURRENCY", "16")),
+    thread_name_prefix="veil-scan",
+)
+
+
+class _BatchScanner:
+    """Coalesces individual scan calls into one POST /scan/batch.
+
+    Buffers up to ``max_batch_size`` texts or ``max_batch_delay_ms`` of
+    wall-clock time (TorchServe-style maxBatchDelay), then flushes the
+    buffer as a single request and fans results back out per caller.
+    A buffer holding a single text falls back to the plain /scan endpoint.
+    """
+
+    def __init__(
+        self,
+        handler: "AgentVeilCallbackHandler",
+        max_batch_size: int = 16,
+        max_batch_delay_ms: int = 20,
+    ):
+        self._handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay_ms / 1000.0
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="veil-scan-batch", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_batch_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list) -> None:
+        # Never let an exception escape: it would kill the worker thread
+        # and leave every later submit() blocking on a dead queue.
+        try:
+            if len(batch) == 1:
+                text, future = batch[0]
+                future.set_result(self._handler._scan_single(text))
+                return
+            results = self._handler._scan_batch([text for text, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
 
 
 class AgentVeilCallbackHandler:
@@ -31,32 +245,70 @@ class AgentVeilCallbackHandler:
         api_key: str | None = None,
         session_id: str | None = None,
         block_on_pii: bool = False,
+        batch_size: int = 16,
+        batch_delay_ms: int = 20,
+        cache_enabled: bool = True,
+        cache_size: int = 4096,
+        cheap_filter: bool = True,
+        non_pii_terms: list[str] | None = None,
     ):
         self.proxy_url = proxy_url or os.getenv("VEIL_PROXY_URL", "http://localhost:8080")
         self.api_key = api_key or os.getenv("VEIL_API_KEY", "")
         self.session_id = session_id or os.getenv("VEIL_SESSION_ID", "langchain")
         self.block_on_pii = block_on_pii
+        self.cache_enabled = cache_enabled
+        self.cache_size = cache_size
+        self.cheap_filter = cheap_filter
+        self._allowlist = self._build_allowlist(non_pii_terms)
+        self._scan_url = f"{self.proxy_url}/scan"
+        self._scan_batch_url = f"{self.proxy_url}/scan/batch"
+        self._scan_headers = self._scan_request_headers()
+        self._scan_cache: collections.OrderedDict = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
         self._findings: list[dict] = []
+        self._findings_lock = threading.Lock()
+        self._scanner = (
+            _BatchScanner(self, batch_size, batch_delay_ms) if batch_size > 1 else None
+        )
+        # Flipped to False on the first 404 from /scan/batch (the bundled
+        # proxy only serves /scan); scans then bypass the batcher so the
+        # thread-pool fan-out still applies.
+        self._scan_batch_supported = True
 
     def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any) -> None:
         """Scan prompts for PII before sending to LLM."""
-        for prompt in prompts:
-            result = self._scan(prompt)
-            if result and result.get("found"):
-                self._findings.extend(result.get("entities", []))
-                if self.block_on_pii:
-                    raise PIIDetectedError(
-                        f"PII detected in prompt: {len(result['entities'])} entities found"
-                    )
+        entities = self._collect(self._scan_all(prompts))
+        if entities and self.block_on_pii:
+            raise PIIDetectedError(
+                f"PII detected in prompt: {len(entities)} entities found"
+            )
 
     def on_llm_end(self, response: Any, **kwargs: Any) -> None:
         """Scan LLM output for PII leakage."""
-        if hasattr(response, "generations"):
-            for gen_list in response.generations:
-                for gen in gen_list:
-                    result = self._scan(gen.text)
-                    if result and result.get("found"):
-                        self._findings.extend(result.get("entities", []))
+        if not hasattr(response, "generations"):
+            return
+        texts = [gen.text for gen_list in response.generations for gen in gen_list]
+        self._collect(self._scan_all(texts))
+
+    def _scan_all(self, texts: list[str]) -> list[dict | None]:
+        if len(texts) <= 1:
+            return [self._scan(text) for text in texts]
+        futures = [_SCAN_POOL.submit(self._scan, text) for text in texts]
+        return [future.result() for future in as_completed(futures)]
+
+    def _collect(self, results: list[dict | None]) -> list[dict]:
+        """Merge scan results into findings with a single locked extend."""
+        entities = list(
+            chain.from_iterable(
+                result.get("entities", [])
+                for result in results
+                if result and result.get("found")
+            )
+        )
+        if entities:
+            with self._findings_lock:
+                self._findings.extend(entities)
+        return entities
 
     def on_llm_error(self, error: Exception, **kwargs: Any) -> None:
         pass
@@ -66,28 +318,173 @@ class AgentVeilCallbackHandler:
         return self._findings
 
     def clear_findings(self) -> None:
-        self._findings = []
+        with self._findings_lock:
+            self._findings = []
+
+    def clear_scan_cache(self) -> None:
+        with self._cache_lock:
+            self._scan_cache.clear()
+
+    @staticmethod
+    def _build_allowlist(terms: list[str] | None) -> frozenset[str] | None:
+        """Index known non-PII terms (SKUs, brand names, env vars) for O(1)
+        per-token membership checks; no extra dependency needed."""
+        return frozenset(terms) if terms else None
+
+    def _allowlisted(self, text: str) -> bool:
+        """True when every whitespace token is a known non-PII term."""
+        tokens = text.split()
+        return bool(tokens) and all(tok in self._allowlist for tok in tokens)
 
     def _scan(self, text: str) -> dict | None:
+        if self._allowlist is not None and self._allowlisted(text):
+            return None
+        if self.cheap_filter and self._obviously_clean(text):
+            return None
+        if not self.cache_enabled:
+            return self._scan_remote(text)
+
+        key = self._cache_key(text)
+        with self._cache_lock:
+            if key in self._scan_cache:
+                self._scan_cache.move_to_end(key)
+                return self._scan_cache[key]
+
+        result = self._scan_remote(text)
+        if result is not None:  # never cache transport failures
+            with self._cache_lock:
+                self._scan_cache[key] = result
+                if len(self._scan_cache) > self.cache_size:
+                    self._scan_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _obviously_clean(text: str) -> bool:
+        """True when a short text cannot match any server-side PII pattern."""
+        if len(text) >= 32:
+            return False
+        if _CHEAP_PII_RE.search(text):
+            return False
+        lowered = text.lower()
+        return not any(keyword in lowered for keyword in _VN_PII_KEYWORDS)
+
+    def _cache_key(self, text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf-8"),
+            digest_size=16,
+            key=self.session_id.encode("utf-8")[:64],
+        ).digest()
+
+    def _scan_remote(self, text: str) -> dict | None:
+        if self._scanner is not None and self._scan_batch_supported:
+            try:
+                return self._scanner.submit(text).result(timeout=15)
+            # _scan is fail-open: a queue timeout behind a slow flush or an
+            # exception set on the future must not escape into the callbacks.
+            except Exception:
+                return self._scan_single(text)
+        return self._scan_single(text)
+
+    def _scan_single(self, text: str) -> dict | None:
         try:
-            headers = {"Content-Type": "application/json"}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            if self.session_id:
-                headers["X-Session-ID"] = self.session_id
-
-            resp = requests.post(
-                f"{self.proxy_url}/scan",
-                json={"text": text},
-                headers=headers,
+            resp = _thread_session().post(
+                self._scan_url,
+                data=_dumps({"text": text}),
+                headers=self._scan_headers,
                 timeout=10,
             )
             if resp.status_code == 200:
-                return resp.json()
-        except requests.RequestException:
+                return _loads(resp.content)
+        # ValueError covers orjson/stdlib JSONDecodeError on malformed 200s,
+        # matching the old resp.json() behaviour (its decode error was a
+        # RequestException subclass).
+        except (requests.RequestException, ValueError):
             pass
         return None
 
+    def _scan_batch(self, texts: list[str]) -> list[dict | None]:
+        try:
+            resp = _thread_session().post(
+                self._scan_batch_url,
+                data=_dumps({"texts": texts}),
+                headers=self._scan_headers,
+                timeout=10,
+            )
+            if resp.status_code == 200:
+                results = _loads(resp.content).get("results", [])
+                if len(results) == len(texts):
+                    return results
+            elif resp.status_code < 500:
+                # No real batch endpoint behind this path: 404 in
+                # single-target mode, 401 or a reverse-proxied reply from
+                # the router's catch-all. 5xx stays retryable.
+                self._scan_batch_supported = False
+        except (requests.RequestException, ValueError):
+            pass
+        return [self._scan_single(text) for text in texts]
+
+    def _scan_request_headers(self) -> dict[str, str]:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        if self.session_id:
+            headers["X-Session-ID"] = self.session_id
+        return headers
+
+
+class _ChatCoalescer:
+    """Merges concurrent invoke() calls into one batch_invoke request.
+
+    Same buffer-then-flush algorithm as _BatchScanner: collect up to
+    ``max_batch`` prompts or ``window_ms`` of wall-clock time, then send
+    them as a single batch; each caller blocks on its own future.
+    """
+
+    def __init__(self, model: "AgentVeilChatModel", window_ms: int = 10, max_batch: int = 16):
+        self._model = model
+        self.max_batch = max_batch
+        self.window = window_ms / 1000.0
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="veil-chat-coalesce", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list) -> None:
+        try:
+            if len(batch) == 1:
+                text, future = batch[0]
+                future.set_result(
+                    self._model._chat([{"role": "user", "content": text}])
+                )
+                return
+            results = self._model.batch_invoke([text for text, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
 
 class AgentVeilChatModel:
     """
@@ -107,6 +504,8 @@ class AgentVeilChatModel:
         role: str = "admin",
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        batch_window_ms: int = 0,
+        transport: str = "sse",
     ):
         self.proxy_url = proxy_url or os.getenv("VEIL_PROXY_URL", "http://localhost:8080")
         self.api_key = api_key or os.getenv("VEIL_API_KEY", "")
@@ -117,12 +516,82 @@ class AgentVeilChatModel:
         self.role = role
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.transport = transport  # "sse" (default) or "grpc"
+        self._session = _SESSION
+        # Response cache for deterministic calls (temperature == 0 only).
+        self._chat_cache: collections.OrderedDict = collections.OrderedDict()
+        self._chat_cache_lock = threading.Lock()
+        self._chat_cache_size = 256
+        self._async_client = None  # httpx.AsyncClient, created on first await
+        # Snapshot URLs and headers once; per-call construction is dead work.
+        # Mutating api_key/session_id/role after init requires rebuilding
+        # _base_headers via _build_headers().
+        self._chat_url = f"{self.proxy_url}/v1/chat/completions"
+        self._batch_url = f"{self.proxy_url}/v1/chat/completions/batch"
+        self._base_headers = self._build_headers()
+        self._stream_headers = MappingProxyType(
+            {**self._base_headers, "Accept": "text/event-stream"}
+        )
+        self._post_chat = functools.partial(self._session.post, self._chat_url)
+        # Flipped to False when the proxy has no real batch endpoint, so
+        # invoke() stops paying doomed coalescing round-trips.
+        self._batch_invoke_supported = True
+        self._coalescer = (
+            _ChatCoalescer(self, batch_window_ms) if batch_window_ms > 0 else None
+        )
 
     def invoke(self, input_text: str, **kwargs: Any) -> str:
         """Send a single message and get response."""
+        if (
+            self._coalescer is not None
+            and self._batch_invoke_supported
+            and not kwargs
+        ):
+            return self._coalescer.submit(input_text).result(timeout=120)
         messages = [{"role": "user", "content": input_text}]
         return self._chat(messages, **kwargs)
 
+    def batch_invoke(self, inputs: list[str], **kwargs: Any) -> list[str]:
+        """Send many independent prompts as a single batched proxy request."""
+        if not inputs:
+            return []
+        if len(inputs) == 1 or not self._batch_invoke_supported:
+            return [
+                self._chat([{"role": "user", "content": text}], **kwargs)
+                for text in inputs
+            ]
+
+        headers = dict(self._base_headers)
+        payload = {
+            "model": kwargs.get("model", self.model),
+            "temperature": kwargs.get("temperature", self.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+            "batch": [
+                {"messages": [{"role": "user", "content": text}]} for text in inputs
+            ],
+        }
+        try:
+            resp = self._session.post(
+                self._batch_url,
+                data=_dumps(payload),
+                headers=headers,
+                timeout=120,
+            )
+            if resp.status_code == 200:
+                responses = _loads(resp.content).get("responses", [])
+                if len(responses) == len(inputs):
+                    return [self._first_content(r) for r in responses]
+            elif resp.status_code < 500:
+                # Same memoization as _scan_batch: 404 single-target, 401 or
+                # a reverse-proxied reply from the router catch-all.
+                self._batch_invoke_supported = False
+        except (requests.RequestException, ValueError):
+            pass
+        # Proxy without batch support: fall back to one call per prompt.
+        return [
+            self._chat([{"role": "user", "content": text}], **kwargs) for text in inputs
+        ]
+
     def chat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
         """Send messages and get response."""
         return self._chat(messages, **kwargs)
@@ -132,61 +601,216 @@ class AgentVeilChatModel:
         messages = [{"role": "user", "content": input_text}]
         return self._stream(messages, **kwargs)
 
-    def _chat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
-        headers = self._build_headers()
-        payload = {
-            "model": kwargs.get("model", self.model),
-            "messages": messages,
-            "temperature": kwargs.get("temperature", self.temperature),
-            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-        }
+    async def ainvoke(self, input_text: str, **kwargs: Any) -> str:
+        """Async variant of invoke over a multiplexed HTTP/2 connection."""
+        messages = [{"role": "user", "content": input_text}]
+        return await self._achat(messages, **kwargs)
+
+    async def abatch(self, inputs: list[str], **kwargs: Any) -> list[str]:
+        """Run many invokes concurrently; HTTP/2 shares one connection."""
+        return list(await asyncio.gather(*[self.ainvoke(text, **kwargs) for text in inputs]))
 
-        resp = requests.post(
-            f"{self.proxy_url}/v1/chat/completions",
-            json=payload,
+    async def astream(self, input_text: str, **kwargs: Any):
+        """Async variant of stream; yields content chunks."""
+        messages = [{"role": "user", "content": input_text}]
+        headers = self._stream_headers
+        payload = self._build_payload(messages, kwargs, stream=True)
+        cache_hint = self._prompt_cache_key(messages, kwargs)
+        if cache_hint:
+            payload["prompt_cache_key"] = cache_hint
+            headers = {**headers, "X-Prompt-Cache-Key": cache_hint}
+
+        client = self._get_async_client()
+        async with client.stream(
+            "POST",
+            self._chat_url,
+            content=_dumps(payload),
+            headers=headers,
+            timeout=120,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:].strip()
+                if data == "[DONE]":
+                    return
+                try:
+                    chunk = _loads(data)
+                except ValueError:
+                    continue
+                choices = chunk.get("choices")
+                if choices:
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+
+    async def _achat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+        headers = dict(self._base_headers)
+        payload = self._build_payload(messages, kwargs)
+        cache_hint = self._prompt_cache_key(messages, kwargs)
+        if cache_hint:
+            payload["prompt_cache_key"] = cache_hint
+            headers["X-Prompt-Cache-Key"] = cache_hint
+
+        client = self._get_async_client()
+        resp = await client.post(
+            self._chat_url,
+            content=_dumps(payload),
             headers=headers,
-            timeout=60,
         )
         resp.raise_for_status()
-        data = resp.json()
+        return self._first_content(_loads(resp.content))
 
+    @staticmethod
+    def _first_content(data: dict) -> str:
         if "choices" in data and len(data["choices"]) > 0:
             return data["choices"][0]["message"]["content"]
         return ""
 
-    def _stream(self, messages: list[dict[str, str]], **kwargs: Any) -> Iterator[str]:
-        headers = self._build_headers()
-        headers["Accept"] = "text/event-stream"
-        payload = {
+    def _get_async_client(self):
+        if httpx is None:
+            raise RuntimeError(
+                "httpx is required for async methods: pip install 'httpx[http2]'"
+            )
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=60,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return self._async_client
+
+    def _build_payload(
+        self, messages: list[dict[str, str]], kwargs: dict, stream: bool = False
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
             "model": kwargs.get("model", self.model),
             "messages": messages,
             "temperature": kwargs.get("temperature", self.temperature),
             "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-            "stream": True,
         }
+        if stream:
+            payload["stream"] = True
+        return payload
 
-        resp = requests.post(
-            f"{self.proxy_url}/v1/chat/completions",
-            json=payload,
-            headers=headers,
-            stream=True,
-            timeout=120,
+    def _chat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+        headers = dict(self._base_headers)
+        payload = self._build_payload(messages, kwargs)
+
+        cache_hint = self._prompt_cache_key(messages, kwargs)
+        if cache_hint:
+            payload["prompt_cache_key"] = cache_hint
+            headers["X-Prompt-Cache-Key"] = cache_hint
+
+        cache_key = None
+        if payload["temperature"] == 0:
+            # Hash the whole payload so max_tokens (and any future field)
+            # differentiates cached responses, not just model + messages.
+            cache_key = hashlib.blake2b(
+                json.dumps(payload, sort_keys=True).encode("utf-8"), digest_size=16
+            ).digest()
+            with self._chat_cache_lock:
+                if cache_key in self._chat_cache:
+                    self._chat_cache.move_to_end(cache_key)
+                    return self._chat_cache[cache_key]
+
+        resp = self._post_chat(data=_dumps(payload), headers=headers, timeout=60)
+        resp.raise_for_status()
+        content = self._first_content(_loads(resp.content))
+
+        if cache_key is not None:
+            with self._chat_cache_lock:
+                self._chat_cache[cache_key] = content
+                if len(self._chat_cache) > self._chat_cache_size:
+                    self._chat_cache.popitem(last=False)
+        return content
+
+    def _stream(self, messages: list[dict[str, str]], **kwargs: Any) -> Iterator[str]:
+        if self.transport == "grpc":
+            return self._stream_grpc(messages, **kwargs)
+        return self._stream_sse(messages, **kwargs)
+
+    def _stream_grpc(self, messages: list[dict[str, str]], **kwargs: Any) -> Iterator[str]:
+        if vura_grpc is None or not vura_grpc.available():
+            raise RuntimeError(
+                "transport='grpc' requires the vura_grpc module and grpcio"
+            )
+        payload = self._build_payload(messages, kwargs, stream=True)
+        metadata = [
+            (key.lower(), value)
+            for key, value in self._base_headers.items()
+            if key.lower() != "content-type"
+        ]
+        stream = vura_grpc.stream_chat(
+            vura_grpc.grpc_target(self.proxy_url), payload, metadata=metadata
+        )
+        yielded = False
+        try:
+            for content in stream:
+                yielded = True
+                yield content
+            return
+        except Exception as exc:
+            # Replaying over SSE after chunks went out would duplicate
+            # content, so a mid-stream failure propagates instead.
+            if yielded or not vura_grpc.is_unsupported(exc):
+                raise
+        # No usable gRPC at the target: replay the request over SSE.
+        yield from self._stream_sse(messages, **kwargs)
+
+    def _stream_sse(self, messages: list[dict[str, str]], **kwargs: Any) -> Iterator[str]:
+        headers = self._stream_headers
+        payload = self._build_payload(messages, kwargs, stream=True)
+
+        cache_hint = self._prompt_cache_key(messages, kwargs)
+        if cache_hint:
+            payload["prompt_cache_key"] = cache_hint
+            headers = {**headers, "X-Prompt-Cache-Key": cache_hint}
+
+        resp = self._post_chat(
+            data=_dumps(payload), headers=headers, stream=True, timeout=120
         )
         resp.raise_for_status()
 
-        for line in resp.iter_lines(decode_unicode=True):
-            if line and line.startswith("data: "):
-                data = line[6:].strip()
-                if data == "[DONE]":
-                    return
-                try:
-                    chunk = json.loads(data)
-                    if "choices" in chunk and len(chunk["choices"]) > 0:
-                        delta = chunk["choices"][0].get("delta", {})
-                        if "content" in delta:
-                            yield delta["content"]
-                except json.JSONDecodeError:
-                    continue
+        # Iterate raw bytes: skips per-line unicode decoding and lets orjson
+        # parse UTF-8 directly, which matters at one event per token.
+        for line in resp.iter_lines(decode_unicode=False, chunk_size=8192):
+            if not line or not line.startswith(_SSE_DATA_PREFIX):
+                continue
+            payload = line[6:].strip()
+            if payload == _SSE_DONE:
+                return
+            try:
+                chunk = _loads(payload)
+            except ValueError:
+                continue
+            choices = chunk.get("choices")
+            if choices:
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
+
+    def _prompt_cache_key(self, messages: list[dict[str, str]], kwargs: dict) -> str | None:
+        """Derive a prompt-cache affinity key from the static message prefix.
+
+        Hashes every leading message before the first user turn (system
+        prompts, few-shot examples) so identical prefixes hit the same
+        warmed cache shard upstream. Callers can override via
+        ``prompt_cache_key=...``.
+        """
+        override = kwargs.get("prompt_cache_key")
+        if override:
+            return override
+
+        prefix = []
+        for msg in messages:
+            if msg.get("role") == "user":
+                break
+            prefix.append(msg.get("content", ""))
+        if not prefix:
+            return None
+        return hashlib.sha256("\x00".join(prefix).encode("utf-8")).hexdigest()[:32]
 
     def _build_headers(self) -> dict[str, str]:
         headers: dict[str, str] = {"Content-Type": "application/json"}
@@ -216,21 +840,20 @@ class AgentVeilAuditor:
     ):
         self.proxy_url = proxy_url or os.getenv("VEIL_PROXY_URL", "http://localhost:8080")
         self.api_key = api_key or os.getenv("VEIL_API_KEY", "")
-
-    def audit(self, content: str) -> dict:
-        """Audit skill.md content and return compliance report."""
+        self._session = _SESSION
+        self._audit_url = f"{self.proxy_url}/audit"
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
-
-        resp = requests.post(
-            f"{self.proxy_url}/audit",
-            json={"content": content},
-            headers=headers,
-            timeout=30,
+        self._post_audit = functools.partial(
+            self._session.post, self._audit_url, headers=headers, timeout=30
         )
+
+    def audit(self, content: str) -> dict:
+        """Audit skill.md content and return compliance report."""
+        resp = self._post_audit(data=_dumps({"content": content}))
         resp.raise_for_status()
-        return resp.json()
+        return _loads_large(resp.content)
 
     def audit_file(self, path: str) -> dict:
         """Audit a skill.md file from disk."""
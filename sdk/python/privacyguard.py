@@ -14,16 +14,90 @@ Cách 3 - Wrap bất kỳ HTTP session nào:
     resp = session.post(url, json=payload)
 """
 
+import functools
+import json
+import random
+import socket
 import uuid
 import os
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # orjson là tuỳ chọn; fallback về json stdlib
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Tắt Nagle để POST nhỏ không bị giữ lại chờ ACK (tới 40ms mỗi request).
+_NODELAY_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+if hasattr(socket, "TCP_QUICKACK"):  # chỉ có trên Linux
+    _NODELAY_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
+
+class _NoDelayAdapter(HTTPAdapter):
+    _SOCKET_OPTIONS = list(HTTPConnection.default_socket_options) + _NODELAY_OPTIONS
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def _build_session() -> requests.Session:
+    """Session dùng chung cho các HTTP helper (keep-alive + retry + pool)."""
+    session = requests.Session()
+    adapter = _NoDelayAdapter(
+        pool_connections=32,
+        pool_maxsize=128,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+_SESSION = _build_session()
 
 _ACTIVE = False
 _CONFIG = {}
 
+# Seed một lần từ urandom; các lần sau không tốn syscall như uuid.uuid4().
+_RNG = random.Random(int.from_bytes(os.urandom(16), "big"))
+
+# State của _RNG bị copy qua fork(), nên server prefork (gunicorn) sẽ sinh
+# chuỗi id giống hệt nhau ở mọi worker nếu không reseed trong tiến trình con.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=lambda: _RNG.seed(int.from_bytes(os.urandom(16), "big"))
+    )
+
+
+def _fast_uuid() -> str:
+    """Sinh id dạng UUIDv4 cho session.
+
+    Không đủ mạnh về mặt mật mã - chỉ dùng làm session id, không dùng
+    làm auth token.
+    """
+    return str(uuid.UUID(int=_RNG.getrandbits(128), version=4))
+
 
 def activate(
     proxy_url: str = "http://localhost:8080",
@@ -41,7 +115,7 @@ def activate(
         "proxy_url": proxy_url.rstrip("/"),
         "api_key": api_key or os.environ.get("OPENAI_API_KEY", ""),
         "role": role,
-        "session_id": session_id or str(uuid.uuid4()),
+        "session_id": session_id or _fast_uuid(),
     }
     _ACTIVE = True
 
@@ -62,31 +136,53 @@ def is_active() -> bool:
     return _ACTIVE
 
 
+class _SharedPoolSession(requests.Session):
+    """Session dùng chung adapter (connection pool) với prototype."""
+
+    def close(self) -> None:
+        # Adapter thuộc về prototype trong lru_cache; close() (vd. dùng
+        # ``with``) không được đóng pool chung của các session khác -
+        # chỉ bỏ tham chiếu.
+        self.adapters.clear()
+
+
+@functools.lru_cache(maxsize=64)
+def _proto_session(proxy_url: str, role: str, api_key: str) -> requests.Session:
+    """Session mẫu cho mỗi (proxy_url, role, api_key) - chỉ build một lần."""
+    session = _build_session()
+    session.headers["X-User-Role"] = role
+    if api_key:
+        session.headers["Authorization"] = f"Bearer {api_key}"
+    return session
+
+
 def create_session(
     proxy_url: str = "http://localhost:8080",
     api_key: Optional[str] = None,
     role: str = "admin",
     session_id: Optional[str] = None,
 ) -> requests.Session:
-    """Tạo requests.Session đã cấu hình headers Agent Veil."""
-    session = requests.Session()
-    sid = session_id or str(uuid.uuid4())
+    """Tạo requests.Session đã cấu hình headers Agent Veil.
 
-    session.headers.update({
-        "X-Session-ID": sid,
-        "X-User-Role": role,
-    })
-
-    if api_key:
-        session.headers["Authorization"] = f"Bearer {api_key}"
+    Session trả về dùng chung adapter (connection pool) với prototype theo
+    (proxy_url, role, api_key), nên gọi nhiều lần không phải bắt tay TCP/TLS
+    lại; chỉ header X-Session-ID khác nhau giữa các lần gọi.
+    """
+    proto = _proto_session(proxy_url, role, api_key or "")
+    sid = session_id or _fast_uuid()
 
+    session = _SharedPoolSession()
+    session.adapters = proto.adapters
+    session.headers = CaseInsensitiveDict(proto.headers)
+    session.headers["X-Session-ID"] = sid
     return session
 
 
 def audit_skill(proxy_url: str, content: str) -> dict:
     """Gửi nội dung skill.md để kiểm tra bảo mật."""
-    resp = requests.post(
+    resp = _SESSION.post(
         f"{proxy_url.rstrip('/')}/audit",
-        json={"content": content},
+        data=_dumps({"content": content}),
+        headers={"Content-Type": "application/json"},
     )
-    return resp.json()
+    return _loads(resp.content)